@@ -8,28 +8,61 @@ This tool is for ethical reconnaissance only. Use responsibly and with permissio
 """
 
 import argparse
+import asyncio
 import os
+import re
 import sys
 import json
+import mmap
 import time
+import errno
+import random
+import socket
+import struct
 import threading
+import shutil
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import tempfile
 from urllib.parse import urlparse
 from pathlib import Path
 
 # External libraries (install as per instructions)
 import requests
-from scapy.all import sr1, IP, TCP, UDP, ICMP  # For port scanning (requires root on some systems)
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3Error
+from urllib3.util.retry import Retry
+import dns.asyncresolver
+import dns.exception
+import dns.name
+import dns.resolver
+import ijson
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.support.ui import WebDriverWait
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.panel import Panel
 from rich.text import Text
+from rich.traceback import Traceback
 from colorama import Fore, Style, init
 
+try:
+    import uvloop  # Optional: faster event loop for the async DNS brute-force
+except ImportError:
+    uvloop = None
+
+try:
+    import orjson  # Optional: C JSON encoder/decoder for results and massdns output
+except ImportError:
+    orjson = None
+
+try:
+    import blastdns  # Optional: native bulk resolver for very large wordlists
+except ImportError:
+    blastdns = None
+
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
@@ -38,8 +71,43 @@ RESULTS_DIR = "results"
 SCREENSHOTS_DIR = "screenshots"
 LOGS_DIR = "logs"
 DEFAULT_WORDLIST = "wordlists/subdomains.txt"  # Provide your own wordlist
+# nmap's 1000 most frequently open TCP ports
+TOP_PORTS_FILE = Path(__file__).resolve().parent / "wordlists" / "nmap-top-1000.txt"
 DEFAULT_THREADS = 10
 TIMEOUT = 5
+MAX_BODY_BYTES = 1_000_000  # Only the first 1MB of a page is fingerprinted
+RESOLVERS_FILE = Path(__file__).resolve().parent / "resolvers.txt"  # One public resolver IP per line
+DNS_RESOLVERS = ["1.1.1.1", "8.8.8.8", "9.9.9.9", "208.67.222.222"]
+DNS_TIMEOUT = 1.0  # Per query, per resolver; failures are retried on another resolver
+DNS_ATTEMPTS = 2
+PURGATORY_THRESHOLD = 5  # Consecutive failures before a resolver is benched
+PURGATORY_SENTENCE = 1.0  # Seconds a benched resolver sits out
+DNS_WORKERS_PER_THREAD = 50  # DNS worker coroutines per --threads (500 by default)
+PROGRESS_BATCH = 256  # Redraw progress bars every N completed items
+MAX_TABLE_ROWS = 200
+BANNER_BYTES = 256
+BANNER_TIMEOUT = 1.0
+WEB_PORTS = {80, 8000, 8008, 8080, 8081, 8888}  # Plain-HTTP ports that get a HEAD probe
+SYN_BATCH = 64  # SYNs sent between reads of the raw socket
+SYN_RCVBUF = 16 * 1024 * 1024
+SO_RCVBUFFORCE = 33  # Linux-only, not exposed by the socket module; lets root exceed rmem_max
+SCREENSHOT_CONCURRENCY = 4  # Chrome sessions screenshotting in parallel
+SCREENSHOT_SETTLE = 0.3  # Seconds to wait after the page reports complete
+CHROME_ARGS = [
+    "--headless=new",
+    "--no-sandbox",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--blink-settings=imagesEnabled=true",
+    "--window-size=1280,720",
+]
+
+try:
+    import resource
+    FD_LIMIT = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+except ImportError:  # Windows
+    FD_LIMIT = 512
 
 # Create directories
 for dir_name in [RESULTS_DIR, SCREENSHOTS_DIR, LOGS_DIR]:
@@ -48,11 +116,217 @@ for dir_name in [RESULTS_DIR, SCREENSHOTS_DIR, LOGS_DIR]:
 # Rich console for output
 console = Console()
 
+# JSON helpers: orjson when installed, the stdlib otherwise. Both emit bytes.
+if orjson is not None:
+    def _dump_json(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    _load_json = orjson.loads
+else:
+    def _dump_json(obj):
+        return json.dumps(obj, indent=2).encode()
+    _load_json = json.loads
+
+# Body matchers, compiled once and run over raw bytes (no decode or lower() copy)
+_WORDPRESS = re.compile(rb"(?i)wordpress|wp-content|wp-includes")
+_DIR_LISTING = re.compile(rb"Index of /")
+_DEFAULT_PAGE = re.compile(rb"(?i)\bdefault\b")
+
+# Pre-sized view of a pseudo-header + TCP header (32 bytes) for checksumming
+_TCP_WORDS = struct.Struct("!16H")
+
+
+def _checksum(data):
+    """RFC 1071 internet checksum of a 32-byte pseudo-header + TCP header."""
+    total = sum(_TCP_WORDS.unpack(data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+async def _run_workers(items, worker, num_workers):
+    """Run worker(item) for every item on num_workers coroutines fed by a bounded queue.
+
+    The producer blocks once 2 * num_workers items are pending, so memory stays
+    flat however many items there are; a None sentinel stops each worker.
+    """
+    queue = asyncio.Queue(maxsize=num_workers * 2)
+
+    async def produce():
+        for item in items:
+            await queue.put(item)
+        for _ in range(num_workers):
+            await queue.put(None)
+
+    async def consume():
+        while (item := await queue.get()) is not None:
+            await worker(item)
+
+    tasks = [asyncio.create_task(produce())] + [asyncio.create_task(consume()) for _ in range(num_workers)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def _batched_advance(progress, task, total, batch=PROGRESS_BATCH):
+    """Return a callback that counts one completion per call but only redraws
+    the progress task every batch completions (and on the last one)."""
+    done = 0
+
+    def advance():
+        nonlocal done
+        done += 1
+        if done % batch == 0 or done == total:
+            progress.update(task, completed=done)
+
+    return advance
+
+
+def _read_wordlist(path):
+    """Return the non-empty entries of a wordlist as bytes, read through mmap."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm[:].split()  # Splits on any whitespace run and drops empties
+
+
+def _split_undecodable(entries):
+    """Split byte entries into (valid UTF-8 entries, count of the rest)."""
+    valid, bad = [], 0
+    for entry in entries:
+        if not entry.isascii():
+            try:
+                entry.decode()
+            except UnicodeDecodeError:
+                bad += 1
+                continue
+        valid.append(entry)
+    return valid, bad
+
+
+def _load_ports(path=TOP_PORTS_FILE):
+    """Read port numbers from path, one per line; None if path is missing."""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as f:
+        return tuple(int(line) for line in f if line.strip())
+
+
+TOP_PORTS = _load_ports()
+
+
+def _is_ip(address):
+    """True if address is a literal IPv4 or IPv6 address."""
+    for family in (socket.AF_INET, socket.AF_INET6):
+        try:
+            socket.inet_pton(family, address)
+            return True
+        except OSError:
+            pass
+    return False
+
+
+def _load_resolvers(path=RESOLVERS_FILE):
+    """Read resolver IPs from path, one per line, skipping blanks and # comments.
+
+    Returns (resolvers, bad_lines); resolvers falls back to DNS_RESOLVERS when
+    path is missing or holds no valid address.
+    """
+    if not os.path.exists(path):
+        return list(DNS_RESOLVERS), []
+    resolvers, bad = [], []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            (resolvers if _is_ip(line) else bad).append(line)
+    return resolvers or list(DNS_RESOLVERS), bad
+
+
+class _ResolverPool:
+    """Round-robin DNS queries over one async resolver per nameserver.
+
+    A resolver that fails PURGATORY_THRESHOLD times in a row is benched for
+    PURGATORY_SENTENCE seconds. All resolvers share one cache.
+    """
+
+    def __init__(self, nameservers, cache):
+        self.resolvers = []
+        for nameserver in nameservers:
+            resolver = dns.asyncresolver.Resolver(configure=False)
+            resolver.nameservers = [nameserver]
+            resolver.timeout = DNS_TIMEOUT
+            resolver.lifetime = DNS_TIMEOUT
+            resolver.cache = cache
+            self.resolvers.append(resolver)
+        self.failures = [0] * len(self.resolvers)
+        self.benched_until = [0.0] * len(self.resolvers)
+        self.next = 0
+
+    def _pick(self):
+        """Index of the next resolver not in purgatory (or just the next one if all are)."""
+        now = time.monotonic()
+        for _ in range(len(self.resolvers)):
+            i = self.next
+            self.next = (i + 1) % len(self.resolvers)
+            if self.benched_until[i] <= now:
+                return i
+        return i
+
+    async def resolve(self, name, rdtype='A'):
+        for attempt in range(DNS_ATTEMPTS):
+            i = self._pick()
+            try:
+                answer = await self.resolvers[i].resolve(name, rdtype)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+                self.failures[i] = 0  # A definite answer, the resolver is healthy
+                raise
+            except dns.exception.DNSException:
+                self.failures[i] += 1
+                if self.failures[i] >= PURGATORY_THRESHOLD:
+                    self.benched_until[i] = time.monotonic() + PURGATORY_SENTENCE
+                    self.failures[i] = 0
+                if attempt == DNS_ATTEMPTS - 1:
+                    raise
+            else:
+                self.failures[i] = 0
+                return answer
+
+
 class AspenFramework:
     def __init__(self, args):
         self.args = args
         self.console = console
         self.progress = Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), transient=True)
+        # One pooled keep-alive session for every HTTP request the modules make
+        self.session = requests.Session()
+        self.session.headers.update({"User-Agent": "Mozilla/5.0"})
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        # Every lookup goes through one pool; its LRU cache also remembers NXDOMAIN/NoAnswer
+        resolvers_file = args.resolvers or RESOLVERS_FILE
+        self.nameservers, bad = _load_resolvers(resolvers_file)
+        if bad:
+            self.log(f"Ignoring {len(bad)} invalid resolver line(s) in {resolvers_file}: {', '.join(bad[:5])}", "warning")
+        self.resolver = _ResolverPool(self.nameservers, dns.resolver.LRUCache(max_size=100000))
+        self._drivers = []  # Headless Chrome sessions, started on first screenshot
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Release pooled connections and any browsers that were started."""
+        self.session.close()
+        for driver in self._drivers:
+            driver.quit()
+        self._drivers.clear()
 
     def log(self, message, level="info"):
         """Log messages with colors."""
@@ -73,60 +347,61 @@ class AspenFramework:
         if not self.args.save:
             return
         filepath = os.path.join(RESULTS_DIR, filename)
-        with open(filepath, 'w') as f:
-            if json_format:
-                json.dump(data, f, indent=4)
-            else:
+        if json_format:
+            with open(filepath, 'wb') as f:
+                f.write(_dump_json(data))
+        else:
+            with open(filepath, 'w') as f:
                 f.write(data)
         self.log(f"Results saved to {filepath}", "success")
 
     # 1. Subdomain Enumeration
     def enumerate_subdomains(self, domain):
         """Enumerate subdomains using brute-force, wordlist, and API fallback."""
+        return asyncio.run(self._enumerate_subdomains(domain))
+
+    async def _enumerate_subdomains(self, domain):
         self.log("Starting subdomain enumeration...")
         subdomains = set()
-        threads = self.args.threads or DEFAULT_THREADS
 
-        # Brute-force (simple DNS queries)
-        def check_subdomain(sub):
-            try:
-                import dns.resolver
-                answers = dns.resolver.resolve(f"{sub}.{domain}", 'A')
-                for rdata in answers:
-                    subdomains.add(f"{sub}.{domain}")
-            except Exception as e:
-                self.log(f"DNS error for {sub}.{domain}: {e}", "warning")
-
-        # Wordlist-based
+        # Certificate transparency (crt.sh), streamed one certificate at a time
+        try:
+            with self.session.get(
+                f"https://crt.sh/?q=%25.{domain}&output=json",
+                headers={"Accept-Encoding": "gzip"},
+                stream=True,
+                timeout=TIMEOUT
+            ) as response:
+                if response.status_code == 200:
+                    response.raw.decode_content = True  # Gunzip while streaming
+                    try:
+                        lower_domain = domain.lower()
+                        suffix = "." + lower_domain
+                        for entry in ijson.items(response.raw, 'item'):
+                            # One row can carry several SANs separated by newlines
+                            for sub in entry['name_value'].lower().split("\n"):
+                                if sub.startswith("*."):
+                                    sub = sub[2:]
+                                if sub.endswith(suffix) or sub == lower_domain:
+                                    subdomains.add(sub)
+                    except ijson.JSONError:
+                        self.log("crt.sh did not return valid JSON", "warning")
+        except (requests.RequestException, URLLib3Error) as e:
+            self.log(f"API fallback failed: {e}", "warning")
+
+        # Wordlist-based brute-force
         wordlist = self.args.wordlist or DEFAULT_WORDLIST
         if os.path.exists(wordlist):
-            with open(wordlist, 'r') as f:
-                subs = [line.strip() for line in f if line.strip()]
+            subs, bad = _split_undecodable(_read_wordlist(wordlist))
+            if bad:
+                self.log(f"Skipped {bad} wordlist entries that are not valid UTF-8", "warning")
+            # Names stay bytes until a resolver needs them; crt.sh hits need no DNS verification.
+            # Lowercased like the crt.sh names so WWW and www are one query and one result.
+            suffix = f".{domain}".lower().encode()
+            names = {sub.lower() + suffix for sub in subs} - {sub.encode() for sub in subdomains}
             with self.progress as progress:
-                task = progress.add_task("Enumerating subdomains...", total=len(subs))
-                with ThreadPoolExecutor(max_workers=threads) as executor:
-                    futures = [executor.submit(check_subdomain, sub) for sub in subs]
-                    for future in as_completed(futures):
-                        progress.update(task, advance=1)
-
-        # API fallback (e.g., crt.sh)
-        try:
-            response = requests.get(
-                f"https://crt.sh/?q={domain}&output=json",
-                headers={"User-Agent": "Mozilla/5.0"},
-                timeout=TIMEOUT
-            )
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    for entry in data:
-                        sub = entry['name_value'].lower()
-                        if sub.endswith(f".{domain}"):
-                            subdomains.add(sub)
-                except Exception as e:
-                    self.log("crt.sh did not return valid JSON", "warning")
-        except:
-            self.log("API fallback failed", "warning")
+                task = progress.add_task("Enumerating subdomains...", total=len(names))
+                subdomains |= await self._resolve_names(names, _batched_advance(progress, task, len(names)))
 
         result = "\n".join(sorted(subdomains))
         self.save_results(result, f"subdomains_{domain}.txt")
@@ -135,154 +410,429 @@ class AspenFramework:
             self.console.print(s)
         return subdomains
 
+    async def _resolve_names(self, names, advance):
+        """Return (as str) the byte-string names with A records, using the fastest
+        backend available: blastdns, then massdns, then async dnspython."""
+        if blastdns is not None:
+            try:
+                return await self._resolve_blastdns(names)
+            except blastdns.BlastDNSError as e:
+                self.log(f"blastdns failed, falling back: {e}", "warning")
+        if shutil.which("massdns"):
+            try:
+                return await self._resolve_massdns(names)
+            except (OSError, ValueError) as e:  # ValueError: a line that is not JSON
+                self.log(f"massdns failed, falling back: {e}", "warning")
+        return await self._resolve_dnspython(names, advance)
+
+    async def _resolve_blastdns(self, names):
+        """Bulk-resolve with blastdns' Rust engine (yields only names that answered)."""
+        config = blastdns.ClientConfig(
+            max_inflight_per_resolver=2,
+            request_timeout_ms=int(DNS_TIMEOUT * 1000),
+            purgatory_threshold=PURGATORY_THRESHOLD,
+            purgatory_sentence_ms=int(PURGATORY_SENTENCE * 1000),
+        )
+        client = blastdns.Client(self.nameservers, config)
+        return {host.rstrip(".") async for host, _, _ in client.resolve_batch((name.decode() for name in names), "A")}
+
+    async def _resolve_massdns(self, names):
+        """Bulk-resolve by piping names through a massdns subprocess (ndjson output)."""
+        # massdns gets the same validated resolvers as the other backends, not the raw file
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+            f.write("\n".join(self.nameservers))
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "massdns", "-r", f.name, "-t", "A", "-o", "J",
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+            out, _ = await proc.communicate(b"\n".join(names))
+        finally:
+            os.unlink(f.name)
+        if proc.returncode != 0:
+            raise OSError(f"massdns exited with status {proc.returncode}")
+        found = set()
+        for line in out.splitlines():
+            record = _load_json(line)
+            answers = record.get("data", {}).get("answers", [])
+            if record.get("status") == "NOERROR" and any(a.get("type") == "A" for a in answers):
+                found.add(record["name"].rstrip("."))
+        return found
+
+    async def _resolve_dnspython(self, names, advance):
+        """Resolve concurrently on the shared, cached async dnspython resolver pool."""
+        found = set()
+
+        async def check_subdomain(name):
+            name = name.decode()
+            try:
+                await self.resolver.resolve(dns.name.from_text(name), 'A')
+                found.add(name)
+            except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer) as e:
+                self.log(f"No A record for {name}: {e}")  # The usual outcome; only shown with --verbose
+            except dns.exception.DNSException as e:
+                self.log(f"DNS error for {name}: {e}", "warning")
+            advance()
+
+        await _run_workers(names, check_subdomain, self._dns_concurrency())
+        return found
+
+    async def _resolve_host(self, host):
+        """Resolve host to an IPv4 address with the system resolver (honours /etc/hosts)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, socket.gethostbyname, host)
+
     # 2. Port Scanning
     def scan_ports(self, target):
         """Scan ports with service detection."""
+        return asyncio.run(self._scan_ports(target))
+
+    async def _scan_ports(self, target):
         self.log("Starting port scan...")
-        if os.geteuid() != 0:
-            self.log("Port scanning requires root privileges.", "error")
-            return {}
-        open_ports = {}
-        if self.args.top_ports:
-            ports = range(1, 1025)
-        elif self.args.full:
-            ports = range(1, 65536)
+        try:
+            target = socket.gethostbyname(target)
+        except OSError as e:
+            self.log(f"Could not resolve {target}: {e}", "error")
+            return []
+        if self.args.full and not self.args.top_ports:
+            ports = range(1, 65536)  # Iterated lazily, never materialized
         else:
-            ports = range(1, 1025)  # Default to top ports
-
-        def scan_port(port):
-            try:
-                pkt = IP(dst=target)/TCP(dport=port, flags="S")
-                resp = sr1(pkt, timeout=TIMEOUT, verbose=0)
-                if resp is None:
-                    return
-                if resp and resp.haslayer(TCP) and resp[TCP].flags == 0x12:  # SYN-ACK
-                    # Banner grabbing (simple)
-                    service = "unknown"
-                    try:
-                        banner = sr1(IP(dst=target)/TCP(dport=port, flags="A"), timeout=1, verbose=0)
-                        if banner and banner.haslayer(TCP):
-                            service = "detected"  # Placeholder; enhance with nmap-like logic
-                    except:
-                        pass
-                    open_ports[port] = service
-            except:
-                pass
+            ports = TOP_PORTS  # Default to top ports
+            if ports is None:
+                self.log(f"{TOP_PORTS_FILE} not found, scanning ports 1-1024 instead", "warning")
+                ports = range(1, 1025)
 
         with self.progress as progress:
             task = progress.add_task("Scanning ports...", total=len(ports))
-            with ThreadPoolExecutor(max_workers=self.args.threads or DEFAULT_THREADS) as executor:
-                futures = [executor.submit(scan_port, port) for port in ports]
-                for future in as_completed(futures):
-                    progress.update(task, advance=1)
+            advance = _batched_advance(progress, task, len(ports))
+            # Stage 1: sweep every port for the open set only
+            # Only Linux hands inbound TCP to a raw socket; elsewhere SYN-ACKs never arrive
+            sock = None
+            if sys.platform.startswith("linux"):
+                try:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_TCP)
+                except OSError as e:
+                    self.log(f"Raw socket unavailable ({e}), falling back to TCP connect scan", "warning")
+            try:
+                if sock is None:
+                    found = await self._connect_sweep(target, ports, advance)
+                else:
+                    with sock:
+                        found = await self._syn_sweep(sock, target, ports, advance)
+            except OSError as e:
+                self.log(f"Port scan of {target} failed: {e}", "error")
+                return []
 
-        # Output as table
+        # Stage 2: banner-grab only the ports the sweep found open
+        banners = {}
+
+        async def grab(port):
+            banners[port] = await self._grab_banner(target, port)
+
+        await _run_workers(found, grab, self._connect_concurrency())
+        open_ports = sorted(banners.items())  # [(port, service or None)]
+
+        # Output as table, capped so a host with everything open stays readable
         table = Table(title="Open Ports")
         table.add_column("Port", style="cyan")
         table.add_column("Service", style="magenta")
-        for port, service in open_ports.items():
-            table.add_row(str(port), service)
+        for port, service in open_ports[:MAX_TABLE_ROWS]:
+            table.add_row(str(port), service or "-")
+        if len(open_ports) > MAX_TABLE_ROWS:
+            table.add_row("...", f"+{len(open_ports) - MAX_TABLE_ROWS} more")
         self.console.print(table)
 
         # JSON output
-        self.save_results(open_ports, f"ports_{target}.json", json_format=True)
+        self.save_results(dict(open_ports), f"ports_{target}.json", json_format=True)
         return open_ports
 
+    def _dns_concurrency(self):
+        """Number of DNS queries in flight at once; each holds a UDP socket, so kept under the fd limit."""
+        return max(min((self.args.threads or DEFAULT_THREADS) * DNS_WORKERS_PER_THREAD, FD_LIMIT - 64), 1)
+
+    def _connect_concurrency(self):
+        """Number of TCP connections to keep open at once, kept under the fd limit."""
+        return max(min((self.args.threads or DEFAULT_THREADS) * 100, FD_LIMIT - 64), 1)
+
+    async def _grab_banner(self, target, port):
+        """Read what a service sends on connect (after a HEAD request on web ports);
+        None if it sends nothing."""
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_connection(target, port), BANNER_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            return None
+        try:
+            if port in WEB_PORTS:
+                writer.write(b"HEAD / HTTP/1.0\r\n\r\n")
+                await writer.drain()
+            data = await asyncio.wait_for(reader.read(BANNER_BYTES), BANNER_TIMEOUT)
+        except (OSError, asyncio.TimeoutError):
+            data = b""
+        finally:
+            writer.close()
+        text = data.decode("latin-1")
+        for line in text.splitlines():
+            if line.lower().startswith("server:"):
+                return line[7:].strip()
+        return text.split("\n", 1)[0].strip() or None
+
+    async def _connect_sweep(self, target, ports, advance):
+        """Find open ports with concurrent non-blocking TCP connects."""
+        loop = asyncio.get_running_loop()
+        found = []
+
+        async def scan(port):
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            s.setblocking(False)
+            try:
+                await asyncio.wait_for(loop.sock_connect(s, (target, port)), TIMEOUT)
+                if s.getsockname() != s.getpeername():  # Ignore loopback self-connects
+                    found.append(port)
+            except (OSError, asyncio.TimeoutError):
+                pass
+            finally:
+                s.close()
+            advance()
+
+        await _run_workers(ports, scan, self._connect_concurrency())
+        return sorted(found)
+
+    async def _syn_sweep(self, sock, target, ports, advance):
+        """Find open ports by sending SYNs from the raw socket sock and collecting SYN-ACKs."""
+        loop = asyncio.get_running_loop()
+        sock.setblocking(False)
+        # Every RST from a closed port lands here too; a big buffer keeps SYN-ACKs from being dropped
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, SO_RCVBUFFORCE, SYN_RCVBUF)
+        except OSError:  # Not Linux, or no CAP_NET_ADMIN: capped at net.core.rmem_max
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SYN_RCVBUF)
+
+        # Source address the kernel will use to reach the target (needed for the checksum)
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+            probe.connect((target, 80))
+            src = socket.inet_aton(probe.getsockname()[0])
+        dst = socket.inet_aton(target)
+        sport = random.randint(32768, 60999)
+
+        # Pseudo-header followed by a SYN TCP header; only dport and checksum change per port
+        packet = bytearray(
+            struct.pack("!4s4sBBH", src, dst, 0, socket.IPPROTO_TCP, 20)
+            + struct.pack("!HHIIBBHHH", sport, 0, random.getrandbits(32), 0, 5 << 4, 0x02, 1024, 0, 0)
+        )
+        found = set()
+
+        def on_readable():
+            while True:
+                try:
+                    data = sock.recv(65535)
+                except (BlockingIOError, InterruptedError):
+                    return
+                ihl = (data[0] & 0x0F) * 4
+                if data[12:16] != dst or len(data) < ihl + 14:
+                    continue
+                src_port, dst_port = struct.unpack_from("!HH", data, ihl)
+                if dst_port == sport and data[ihl + 13] & 0x12 == 0x12:  # SYN-ACK
+                    found.add(src_port)
+
+        loop.add_reader(sock.fileno(), on_readable)
+        try:
+            for i, port in enumerate(ports, 1):
+                struct.pack_into("!H", packet, 28, 0)
+                struct.pack_into("!H", packet, 14, port)
+                struct.pack_into("!H", packet, 28, _checksum(packet))
+                while True:
+                    try:
+                        sock.sendto(packet[12:], (target, 0))
+                        break
+                    except OSError as e:
+                        if e.errno not in (errno.EAGAIN, errno.ENOBUFS):
+                            raise
+                        await asyncio.sleep(0.001)
+                advance()
+                if i % SYN_BATCH == 0:
+                    await asyncio.sleep(0)  # Let the reader drain replies
+            await asyncio.sleep(TIMEOUT)  # Wait for late SYN-ACKs
+        finally:
+            loop.remove_reader(sock.fileno())
+        return sorted(found)
+
     # 3. Screenshotting
     def take_screenshot(self, url):
         """Take screenshot of URL using Selenium."""
-        self.log("Taking screenshot...")
-        options = Options()
-        options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        try:
-            driver = webdriver.Chrome(options=options)  # Ensure chromedriver is installed
-        except Exception as e:
-            self.log(f"ChromeDriver error: {e}", "error")
-            return
+        self.take_screenshots_bulk([url])
+
+    def take_screenshots_bulk(self, urls):
+        """Screenshot URLs concurrently on a small pool of reused headless Chrome sessions."""
+        asyncio.run(self._take_screenshots(list(urls)))
+
+    async def _take_screenshots(self, urls):
+        self.log("Taking screenshots...")
+        wanted = min(SCREENSHOT_CONCURRENCY, len(urls))
+        missing = wanted - len(self._drivers)
+        if missing > 0:
+            started = await asyncio.gather(
+                *(asyncio.to_thread(self._start_driver) for _ in range(missing)), return_exceptions=True
+            )
+            errors = []
+            for result in started:
+                if isinstance(result, (WebDriverException, OSError)):
+                    errors.append(result)
+                elif isinstance(result, BaseException):
+                    raise result
+                else:
+                    self._drivers.append(result)
+            for error in errors:
+                self.log(f"ChromeDriver error: {error}", "error")
+            if not self._drivers:
+                return
+            if errors:
+                self.log(f"Screenshotting with {len(self._drivers)} of {wanted} Chrome sessions", "warning")
+
+        # Each worker borrows an idle browser, so no two pages share a session
+        idle = asyncio.Queue()
+        for driver in self._drivers[:wanted]:
+            idle.put_nowait(driver)
+
+        async def shoot(url):
+            driver = await idle.get()
+            try:
+                await asyncio.to_thread(self._capture, driver, url)
+            finally:
+                idle.put_nowait(driver)
+
+        await _run_workers(urls, shoot, idle.qsize())
+
+    def _capture(self, driver, url):
+        """Load url in driver and save a screenshot named after its host."""
         try:
             driver.get(url)
-            time.sleep(2)  # Wait for load
+            WebDriverWait(driver, TIMEOUT).until(
+                lambda d: d.execute_script("return document.readyState === 'complete'")
+            )
+            time.sleep(SCREENSHOT_SETTLE)  # Let late JS paint
             filename = f"{urlparse(url).netloc}.png"
             filepath = os.path.join(SCREENSHOTS_DIR, filename)
             driver.save_screenshot(filepath)
             self.log(f"Screenshot saved to {filepath}", "success")
-        except Exception as e:
-            self.log(f"Screenshot failed: {e}", "error")
-        finally:
-            driver.quit()
+        except (WebDriverException, OSError) as e:
+            self.log(f"Screenshot of {url} failed: {e}", "error")
+
+    def _start_driver(self):
+        """Start a headless Chrome session."""
+        options = Options()
+        for arg in CHROME_ARGS:
+            options.add_argument(arg)
+        driver = webdriver.Chrome(options=options)  # Ensure chromedriver is installed
+        driver.set_page_load_timeout(TIMEOUT)
+        return driver
 
     # 4. Technology Fingerprinting
     def fingerprint_tech(self, url):
         """Detect tech stack."""
         self.log("Fingerprinting technology...")
         try:
-            response = requests.get(url, timeout=TIMEOUT, headers={"User-Agent": "Mozilla/5.0"})
-            headers = response.headers
-            tech = {
-                "server": headers.get("Server", "unknown"),
-                "language": "unknown",  # Heuristic: check for common frameworks
-                "cms": "unknown",
-                "security_headers": {}
-            }
-            # Basic heuristics
-            if "X-Powered-By" in headers:
-                tech["language"] = headers["X-Powered-By"]
-            if "WordPress" in response.text:
-                tech["cms"] = "WordPress"
-            # Security headers
-            sec_headers = ["X-Frame-Options", "Content-Security-Policy", "X-Content-Type-Options"]
-            for h in sec_headers:
-                tech["security_headers"][h] = h in headers
-            self.save_results(tech, f"tech_{urlparse(url).netloc}.json", json_format=True)
-            return tech
-        except Exception as e:
+            response = self.session.get(url, timeout=TIMEOUT)
+        except requests.RequestException as e:
             self.log(f"Fingerprinting failed: {e}", "error")
             return {}
+        return self._tech_from(url, response)
+
+    def _tech_from(self, url, response):
+        """Build and save the tech profile of an already-fetched response."""
+        headers = response.headers
+        tech = {
+            "server": headers.get("Server", "unknown"),
+            "language": "unknown",  # Heuristic: check for common frameworks
+            "cms": "unknown",
+            "security_headers": {}
+        }
+        # Basic heuristics
+        if "X-Powered-By" in headers:
+            tech["language"] = headers["X-Powered-By"]
+        body = response.content[:MAX_BODY_BYTES]
+        if _WORDPRESS.search(body):
+            tech["cms"] = "WordPress"
+        # Security headers
+        sec_headers = ["X-Frame-Options", "Content-Security-Policy", "X-Content-Type-Options"]
+        for h in sec_headers:
+            tech["security_headers"][h] = h in headers
+        self.save_results(tech, f"tech_{urlparse(url).netloc}.json", json_format=True)
+        return tech
 
     # 5. Vulnerability Mapping
     def map_vulns(self, url):
         """Basic vulnerability checks."""
         self.log("Mapping vulnerabilities...")
-        vulns = []
         try:
-            response = requests.get(url, timeout=TIMEOUT)
-            # Checks
-            if "Index of /" in response.text:
-                vulns.append("Directory listing enabled")
-            if response.status_code == 200 and "default" in response.text.lower():
-                vulns.append("Default page detected")
-            headers = response.headers
-            missing_headers = []
-            for h in ["X-Frame-Options", "X-Content-Type-Options"]:
-                if h not in headers:
-                    missing_headers.append(h)
-            if missing_headers:
-                vulns.append(f"Missing security headers: {', '.join(missing_headers)}")
-            if "Server" in headers and "old" in headers["Server"].lower():  # Placeholder
-                vulns.append("Outdated server version")
-            report = "\n".join(vulns) if vulns else "No basic vulnerabilities detected"
-            self.save_results(report, f"vulns_{urlparse(url).netloc}.txt")
-            return report
-        except Exception as e:
+            response = self.session.get(url, timeout=TIMEOUT)
+        except requests.RequestException as e:
             self.log(f"Vuln mapping failed: {e}", "error")
             return "Error in vuln mapping"
+        return self._vulns_from(url, response)
+
+    def _vulns_from(self, url, response):
+        """Build and save the vulnerability report of an already-fetched response."""
+        vulns = []
+        # Checks
+        body = response.content[:MAX_BODY_BYTES]
+        if _DIR_LISTING.search(body):
+            vulns.append("Directory listing enabled")
+        if response.status_code == 200 and _DEFAULT_PAGE.search(body):
+            vulns.append("Default page detected")
+        headers = response.headers
+        missing_headers = []
+        for h in ["X-Frame-Options", "X-Content-Type-Options"]:
+            if h not in headers:
+                missing_headers.append(h)
+        if missing_headers:
+            vulns.append(f"Missing security headers: {', '.join(missing_headers)}")
+        if "Server" in headers and "old" in headers["Server"].lower():  # Placeholder
+            vulns.append("Outdated server version")
+        report = "\n".join(vulns) if vulns else "No basic vulnerabilities detected"
+        self.save_results(report, f"vulns_{urlparse(url).netloc}.txt")
+        return report
+
+    def analyze(self, url):
+        """Fingerprint tech and map vulns from a single fetch of url."""
+        self.log("Fingerprinting technology and mapping vulnerabilities...")
+        try:
+            response = self.session.get(url, timeout=TIMEOUT)
+        except requests.RequestException as e:
+            self.log(f"Analysis failed: {e}", "error")
+            return {"tech": {}, "vulns": "Error in vuln mapping"}
+        return {"tech": self._tech_from(url, response), "vulns": self._vulns_from(url, response)}
 
     def full_scan(self, domain):
         """Run all modules."""
+        asyncio.run(self._full_scan(domain))
+
+    async def _full_scan(self, domain):
         self.log("Starting full scan...")
         url = f"https://{domain}"
-        subdomains = self.enumerate_subdomains(domain)
+        subdomains = await self._enumerate_subdomains(domain)
+        # Once DNS is done the remaining modules are independent; run them together
+        urls = [url]
+        if self.args.screenshot_subdomains:
+            urls += [f"https://{sub}" for sub in sorted(subdomains) if sub != domain]
+        stages = {
+            "Screenshot": self._take_screenshots(urls),
+            "Analysis": asyncio.to_thread(self.analyze, url),
+        }
         # Assume IP from domain for scanning (simplified)
-        import socket
         try:
-            target_ip = socket.gethostbyname(domain)
-            ports = self.scan_ports(target_ip)
-        except:
+            target_ip = await self._resolve_host(domain)
+            stages["Port scan"] = self._scan_ports(target_ip)
+        except OSError:
             self.log("Port scan skipped (DNS resolution failed)", "warning")
-        self.take_screenshot(url)
-        tech = self.fingerprint_tech(url)
-        vulns = self.map_vulns(url)
+        # A failing stage is logged without cancelling the others
+        results = await asyncio.gather(*stages.values(), return_exceptions=True)
+        for name, result in zip(stages, results):
+            if isinstance(result, Exception):
+                self.log(f"{name} stage failed: {result!r}", "error")
+                if not self.args.silent:
+                    self.console.print(Traceback.from_exception(type(result), result, result.__traceback__))
+            elif isinstance(result, BaseException):
+                raise result
         self.log("Full scan complete", "success")
 
 def main():
@@ -345,29 +895,41 @@ def main():
     parser.add_argument("--top-ports", action="store_true", help="Scan top ports only")
     parser.add_argument("--full", action="store_true", help="Full scan (for ports)")
     parser.add_argument("--wordlist", help="Path to wordlist")
+    parser.add_argument(
+        "--screenshot-subdomains", action="store_true", help="Also screenshot every discovered subdomain in fullscan"
+    )
+    parser.add_argument("--resolvers", help=f"File of DNS resolver IPs, one per line (default: {RESOLVERS_FILE})")
 
     args = parser.parse_args()
     if not args.command:
         parser.print_help()
         return
-
-    framework = AspenFramework(args)
-
-    if args.command == "enum":
-        framework.enumerate_subdomains(args.domain)
-    elif args.command == "scan":
-        framework.scan_ports(args.target)
-    elif args.command == "tech":
-        tech = framework.fingerprint_tech(args.url)
-        console.print(json.dumps(tech, indent=4))
-    elif args.command == "screenshot":
-        framework.take_screenshot(args.url)
-    elif args.command == "vulns":
-        report = framework.map_vulns(args.url)
-        console.print(report)
-    elif args.command == "fullscan":
-        framework.full_scan(args.domain)
+    if args.resolvers and not os.path.isfile(args.resolvers):
+        parser.error(f"resolvers file not found: {args.resolvers}")
+
+    if uvloop is not None:
+        uvloop.install()
+
+    with AspenFramework(args) as framework:
+        if args.command == "enum":
+            framework.enumerate_subdomains(args.domain)
+        elif args.command == "scan":
+            framework.scan_ports(args.target)
+        elif args.command == "tech":
+            tech = framework.fingerprint_tech(args.url)
+            console.print(_dump_json(tech).decode())
+        elif args.command == "screenshot":
+            framework.take_screenshot(args.url)
+        elif args.command == "vulns":
+            report = framework.map_vulns(args.url)
+            console.print(report)
+        elif args.command == "fullscan":
+            framework.full_scan(args.domain)
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except KeyboardInterrupt:
+        console.print("Interrupted")
+        sys.exit(130)
 